@@ -26,15 +26,68 @@ SETUP INSTRUCTIONS
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+import numpy as np
+import orjson
 import os
-from typing import Dict, Tuple
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Mock payloads shared by every mock response. These are built once at import
+# time and must be treated as read-only by callers.
+_MOCK_MODALITIES = {
+    "gene_expression": {
+        "score": 0.45,
+        "direction": "decreased",
+        "confidence": 0.82,
+        "note": "Mock data - connect API for real predictions"
+    },
+    "splicing": {
+        "score": 0.12,
+        "direction": "minimal_effect",
+        "confidence": 0.71
+    },
+    "chromatin_accessibility": {
+        "score": -0.33,
+        "direction": "decreased",
+        "confidence": 0.68
+    },
+    "histone_modifications": {
+        "score": 0.08,
+        "direction": "minimal_effect",
+        "confidence": 0.59
+    },
+    "transcription_factor_binding": {
+        "score": -0.28,
+        "direction": "decreased",
+        "confidence": 0.75
+    }
+}
+
+_MOCK_QUANTILE_SCORES = {
+    "gene_expression": {
+        "raw_score": -1.2,
+        "quantile": 0.15,
+        "percentile": "15th percentile",
+        "interpretation": "Effect stronger than 85% of common variants"
+    },
+    "splicing": {
+        "raw_score": 0.05,
+        "quantile": 0.48,
+        "percentile": "48th percentile"
+    }
+}
+
+# Mock reference sequence covering up to 100 kb; ISM regions take a slice of it.
+# Kept as str rather than bytes because it is sent in the JSON request payload.
+_MOCK_REFERENCE_SEQUENCE = "CCCTG" * 20000
+
+
 class AlphaGenomeAPI:
     """Real implementation of AlphaGenome API client."""
     
@@ -47,6 +100,22 @@ class AlphaGenomeAPI:
         "batch": "/batch_predict"
     }
     
+    # Modalities requested for every variant effect prediction
+    PREDICTION_MODALITIES = [
+        "gene_expression",
+        "splicing",
+        "chromatin_accessibility",
+        "histone_modifications",
+        "transcription_factor_binding",
+        "chromatin_contact_maps"
+    ]
+    
+    # Maximum number of variants sent in one /batch_predict request
+    MAX_BATCH_SIZE = 32
+    
+    # Maximum number of cached responses kept before evicting the least recently used
+    CACHE_SIZE = 4096
+    
     def __init__(self, api_key: str = None):
         """
         Initialize AlphaGenome API client.
@@ -65,6 +134,19 @@ class AlphaGenomeAPI:
             "Authorization": f"Bearer {self.api_key}" if self.api_key else "",
             "Content-Type": "application/json"
         }
+        
+        # Reuse pooled keep-alive connections across calls instead of paying a
+        # fresh TCP/TLS handshake for every variant.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Successful responses keyed by (endpoint, serialized payload), up to
+        # CACHE_SIZE entries in least-recently-used order; predictions are
+        # deterministic, so repeated variants skip the network entirely.
+        self._cache: OrderedDict[Tuple[str, bytes], Dict] = OrderedDict()
     
     def predict_variant_effect(
         self,
@@ -87,39 +169,31 @@ class AlphaGenomeAPI:
         Returns:
             Dictionary with predictions for each modality
         """
-        payload = {
-            "chromosome": chromosome,
-            "position": position,
-            "ref": ref_allele,
-            "alt": alt_allele,
-            "organism": organism,
-            "modalities": [
-                "gene_expression",
-                "splicing",
-                "chromatin_accessibility",
-                "histone_modifications",
-                "transcription_factor_binding",
-                "chromatin_contact_maps"
-            ]
-        }
+        payload = self._prediction_payload(chromosome, position, ref_allele, alt_allele, organism)
         
-        logger.info(f"Predicting effects for {chromosome}:{position} {ref_allele}>{alt_allele}")
+        logger.info("Predicting effects for %s:%d %s>%s", chromosome, position, ref_allele, alt_allele)
         
         if not self.api_key:
             logger.warning("No API key - returning mock results")
             return self._mock_prediction(payload)
         
+        key = self._cache_key("predict", payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/predict",
-                json=payload,
-                headers=self.headers,
+                data=orjson.dumps(payload),
                 timeout=60
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
+            result = orjson.loads(response.content)
+            self._cache_put(key, result)
+            return result
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
             return {"error": str(e)}
     
     def score_variant(
@@ -151,25 +225,92 @@ class AlphaGenomeAPI:
             "quantile_normalized": quantile_normalized
         }
         
-        logger.info(f"Scoring variant {chromosome}:{position} {ref_allele}>{alt_allele}")
+        logger.info("Scoring variant %s:%d %s>%s", chromosome, position, ref_allele, alt_allele)
         
         if not self.api_key:
             logger.warning("No API key - returning mock results")
             return self._mock_scores(payload)
         
+        key = self._cache_key("score", payload)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/score",
-                json=payload,
-                headers=self.headers,
+                data=orjson.dumps(payload),
                 timeout=60
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
+            result = orjson.loads(response.content)
+            self._cache_put(key, result)
+            return result
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
             return {"error": str(e)}
     
+    def predict_variant_effect_batch(
+        self,
+        variants: List[Dict],
+        organism: str = "human"
+    ) -> List[Dict]:
+        """
+        Predict variant effects for many variants via the batch endpoint.
+        
+        Variants are sent in chunks of at most MAX_BATCH_SIZE, so N variants
+        cost ceil(N / MAX_BATCH_SIZE) round-trips instead of N.
+        
+        Args:
+            variants: Dicts with "chromosome", "position", "ref" and "alt" keys
+            organism: "human" or "mouse"
+        
+        Returns:
+            Prediction dictionaries, in the same order as `variants`
+        """
+        payloads = [
+            self._prediction_payload(v["chromosome"], v["position"], v["ref"], v["alt"], organism)
+            for v in variants
+        ]
+        
+        logger.info("Predicting effects for %d variants in batches of %d", len(payloads), self.MAX_BATCH_SIZE)
+        
+        if not self.api_key:
+            logger.warning("No API key - returning mock results")
+            return [self._mock_prediction(payload) for payload in payloads]
+        
+        keys = [self._cache_key("predict", payload) for payload in payloads]
+        results = [self._cache_get(key) for key in keys]
+        pending = [i for i, result in enumerate(results) if result is None]
+        
+        for start in range(0, len(pending), self.MAX_BATCH_SIZE):
+            indices = pending[start:start + self.MAX_BATCH_SIZE]
+            try:
+                response = self._session.post(
+                    f"{self.BASE_URL}{self.ENDPOINTS['batch']}",
+                    data=orjson.dumps([payloads[i] for i in indices]),
+                    timeout=60
+                )
+                response.raise_for_status()
+                batch_results = orjson.loads(response.content)
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("API request failed: %s", e)
+                for i in indices:
+                    results[i] = {"error": str(e)}
+                continue
+            
+            if not isinstance(batch_results, list) or len(batch_results) != len(indices):
+                error = f"Batch response does not match the {len(indices)} requested variants"
+                logger.error("API request failed: %s", error)
+                for i in indices:
+                    results[i] = {"error": error}
+                continue
+            
+            for i, result in zip(indices, batch_results):
+                results[i] = result
+                self._cache_put(keys[i], result)
+        return results
+    
     def predict_in_silico_mutagenesis(
         self,
         chromosome: str,
@@ -196,59 +337,68 @@ class AlphaGenomeAPI:
             "reference_sequence": reference_sequence
         }
         
-        logger.info(f"Running ISM for {chromosome}:{start_position}-{end_position}")
+        logger.info("Running ISM for %s:%d-%d", chromosome, start_position, end_position)
         
         if not self.api_key:
             logger.warning("No API key - returning mock results")
             return {"status": "mock_data", "message": "ISM requires API connection"}
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.BASE_URL}/ism",
-                json=payload,
-                headers=self.headers,
+                data=orjson.dumps(payload),
                 timeout=120
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"API request failed: {e}")
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error("API request failed: %s", e)
             return {"error": str(e)}
     
+    @staticmethod
+    def _cache_key(endpoint: str, payload: Dict) -> Tuple[str, bytes]:
+        """Build a hashable response-cache key from an endpoint and payload."""
+        return endpoint, orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    
+    def _cache_get(self, key: Tuple[str, bytes]) -> Optional[Dict]:
+        """Return a cached response and mark it most recently used, or None on a miss."""
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+    
+    def _cache_put(self, key: Tuple[str, bytes], result: Dict) -> None:
+        """Cache a response, evicting the least recently used one beyond CACHE_SIZE."""
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _prediction_payload(
+        self,
+        chromosome: str,
+        position: int,
+        ref_allele: str,
+        alt_allele: str,
+        organism: str
+    ) -> Dict:
+        """Build the request payload for a single variant prediction."""
+        return {
+            "chromosome": chromosome,
+            "position": position,
+            "ref": ref_allele,
+            "alt": alt_allele,
+            "organism": organism,
+            "modalities": self.PREDICTION_MODALITIES
+        }
+    
     def _mock_prediction(self, payload: Dict) -> Dict:
         """Generate mock prediction for testing."""
         return {
             "status": "mock_data",
             "variant": f"{payload['chromosome']}:{payload['position']}:{payload['ref']}>{payload['alt']}",
             "organism": payload['organism'],
-            "modalities": {
-                "gene_expression": {
-                    "score": 0.45,
-                    "direction": "decreased",
-                    "confidence": 0.82,
-                    "note": "Mock data - connect API for real predictions"
-                },
-                "splicing": {
-                    "score": 0.12,
-                    "direction": "minimal_effect",
-                    "confidence": 0.71
-                },
-                "chromatin_accessibility": {
-                    "score": -0.33,
-                    "direction": "decreased",
-                    "confidence": 0.68
-                },
-                "histone_modifications": {
-                    "score": 0.08,
-                    "direction": "minimal_effect",
-                    "confidence": 0.59
-                },
-                "transcription_factor_binding": {
-                    "score": -0.28,
-                    "direction": "decreased",
-                    "confidence": 0.75
-                }
-            }
+            "modalities": _MOCK_MODALITIES
         }
     
     def _mock_scores(self, payload: Dict) -> Dict:
@@ -256,22 +406,69 @@ class AlphaGenomeAPI:
         return {
             "status": "mock_data",
             "variant": f"{payload['chromosome']}:{payload['position']}:{payload['ref']}>{payload['alt']}",
-            "quantile_scores": {
-                "gene_expression": {
-                    "raw_score": -1.2,
-                    "quantile": 0.15,
-                    "percentile": "15th percentile",
-                    "interpretation": "Effect stronger than 85% of common variants"
-                },
-                "splicing": {
-                    "raw_score": 0.05,
-                    "quantile": 0.48,
-                    "percentile": "48th percentile"
-                }
-            }
+            "quantile_scores": _MOCK_QUANTILE_SCORES
         }
 
 
+# ============================================================================
+# IN SILICO MUTAGENESIS HELPERS
+# ============================================================================
+
+# Byte -> one-hot (A, C, G, T) lookup table; any other byte (e.g. N) maps to zeros
+_ONE_HOT_LUT = np.zeros((256, 4), dtype=np.float32)
+for _index, _base in enumerate("ACGT"):
+    _ONE_HOT_LUT[ord(_base)] = _ONE_HOT_LUT[ord(_base.lower())] = np.eye(4, dtype=np.float32)[_index]
+
+
+def one_hot_encode(sequence: str) -> np.ndarray:
+    """
+    One-hot encode a DNA sequence.
+    
+    Args:
+        sequence: DNA sequence (A/C/G/T, case-insensitive; other bases encode as zeros)
+    
+    Returns:
+        Array of shape (L, 4) with columns ordered A, C, G, T
+    """
+    return _ONE_HOT_LUT[np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)]
+
+
+def aggregate_ism(
+    scores: np.ndarray,
+    reference_sequence: str = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Summarize an ISM score matrix per position.
+    
+    Args:
+        scores: Array of shape (4, L) with the effect of each alternate base
+            (A, C, G, T) at each of the L positions
+        reference_sequence: Optional reference sequence of length L; when given,
+            the reference base at each position is excluded from the mean
+    
+    Returns:
+        Tuple of (per-position maximum absolute effect, per-position mean effect)
+    
+    Raises:
+        ValueError: If `scores` is not (4, L) or does not match the reference length
+    """
+    scores = np.asarray(scores, dtype=np.float32)
+    if scores.ndim != 2 or scores.shape[0] != 4:
+        raise ValueError(f"ISM scores must have shape (4, L), got {scores.shape}")
+    if reference_sequence is not None and scores.shape[1] != len(reference_sequence):
+        raise ValueError(
+            f"ISM scores cover {scores.shape[1]} positions but the reference "
+            f"sequence has {len(reference_sequence)} bases"
+        )
+    
+    per_position_max = np.abs(scores).max(axis=0)
+    if reference_sequence is None:
+        return per_position_max, scores.mean(axis=0)
+    
+    alt_mask = 1.0 - one_hot_encode(reference_sequence).T
+    return per_position_max, (scores * alt_mask).sum(axis=0) / alt_mask.sum(axis=0)
+
+
 # ============================================================================
 # SPECIFIC SICKLE CELL ANALYSIS FUNCTIONS
 # ============================================================================
@@ -305,7 +502,7 @@ def analyze_sickle_cell_mutation(api: AlphaGenomeAPI) -> Dict:
     
     logger.info("\nMutation Details:")
     for key, value in mutation_details.items():
-        logger.info(f"  {key}: {value}")
+        logger.info("  %s: %s", key, value)
     
     # Get predictions
     logger.info("\nStep 1: Predicting regulatory effects...")
@@ -327,12 +524,23 @@ def analyze_sickle_cell_mutation(api: AlphaGenomeAPI) -> Dict:
     
     # In silico mutagenesis around the mutation
     logger.info("\nStep 3: Running in silico mutagenesis (ISM)...")
+    ism_start = mutation_details["position"] - 50
+    ism_end = mutation_details["position"] + 50
+    ism_sequence = _MOCK_REFERENCE_SEQUENCE[:ism_end - ism_start]  # Mock sequence
     ism_results = api.predict_in_silico_mutagenesis(
         chromosome=mutation_details["chromosome"],
-        start_position=mutation_details["position"] - 50,
-        end_position=mutation_details["position"] + 50,
-        reference_sequence="CCCTG" * 20  # Mock sequence
+        start_position=ism_start,
+        end_position=ism_end,
+        reference_sequence=ism_sequence
     )
+    if "scores" in ism_results:
+        try:
+            per_position_max, per_position_mean = aggregate_ism(ism_results["scores"], ism_sequence)
+        except ValueError as e:
+            logger.warning("Skipping ISM summaries: %s", e)
+        else:
+            ism_results["per_position_max"] = per_position_max
+            ism_results["per_position_mean"] = per_position_mean
     
     return {
         "mutation_details": mutation_details,
@@ -377,18 +585,12 @@ def compare_hemoglobin_variants(api: AlphaGenomeAPI) -> Dict:
     logger.info("COMPARING HEMOGLOBIN VARIANTS")
     logger.info("=" * 80)
     
-    comparison_results = {}
+    # Submit all variants through the batch endpoint in a single round-trip.
+    all_predictions = api.predict_variant_effect_batch(list(variants.values()))
     
-    for variant_id, variant_info in variants.items():
-        logger.info(f"\nAnalyzing {variant_info['name']}...")
-        
-        predictions = api.predict_variant_effect(
-            chromosome=variant_info["chromosome"],
-            position=variant_info["position"],
-            ref_allele=variant_info["ref"],
-            alt_allele=variant_info["alt"]
-        )
-        
+    comparison_results = {}
+    for (variant_id, variant_info), predictions in zip(variants.items(), all_predictions):
+        logger.info("\nAnalyzed %s", variant_info["name"])
         comparison_results[variant_id] = {
             "info": variant_info,
             "predictions": predictions
@@ -463,7 +665,11 @@ if __name__ == "__main__":
         "report": report
     }
     
-    with open("/home/claude/sickle_cell_alphagenome_results.json", "w") as f:
-        json.dump(output, f, indent=2, default=str)
+    with open("/home/claude/sickle_cell_alphagenome_results.json", "wb") as f:
+        f.write(orjson.dumps(
+            output,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ))
     
     logger.info("\nResults saved to sickle_cell_alphagenome_results.json")
@@ -13,28 +13,38 @@ AlphaGenome can help predict.
 
 Dependencies:
     - requests (for API calls)
-    - json (for data handling)
-    - pandas (for data organization)
+    - orjson (for data handling)
 """
 
 import requests
-import json
-import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+import io
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Tuple, Optional
 from dataclasses import dataclass
 import logging
+import threading
+from collections import OrderedDict
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Single-nucleotide alleles accepted by SickleCellMutation (compared upper-cased);
+# a multi-base string is never a member, so one lookup checks both the length and
+# the base.
+_VALID_BASES = frozenset("ACGT")
 
-@dataclass
-class SickleCell Mutation:
+
+@dataclass(frozen=True)
+class SickleCellMutation:
     """Data class for sickle cell mutation details."""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10+
+    __slots__ = (
+        "chromosome", "position", "ref_allele", "alt_allele",
+        "gene", "disease", "hgvs_notation", "clinical_significance"
+    )
+    
     chromosome: str
     position: int
     ref_allele: str
@@ -46,8 +56,21 @@ class SickleCell Mutation:
     
     def __post_init__(self):
         """Validate mutation data."""
-        if len(self.ref_allele) != 1 or len(self.alt_allele) != 1:
-            logger.warning("This is a SNV (single nucleotide variant)")
+        if (
+            self.ref_allele.upper() not in _VALID_BASES
+            or self.alt_allele.upper() not in _VALID_BASES
+        ):
+            logger.warning("This is not a SNV (single nucleotide variant) with valid bases")
+
+
+class Variant(NamedTuple):
+    """Lightweight record for a variant to predict; the first four fields identify it."""
+    chromosome: str
+    position: int
+    ref_allele: str
+    alt_allele: str
+    gene: str = ""
+    description: str = ""
 
 
 class AlphaGenomePredictor:
@@ -56,18 +79,85 @@ class AlphaGenomePredictor:
     
     This class handles variant predictions using the AlphaGenome API.
     More info: http://deepmind.google.com/science/alphagenome
+    
+    Requests go over HTTP/1.1 through a pooled keep-alive requests.Session, which
+    allows up to MAX_CONCURRENT_REQUESTS simultaneous requests, each on its own
+    reused connection, without new handshakes.
     """
     
-    def __init__(self, api_endpoint: str = "http://deepmind.google.com/science/alphagenome"):
+    __slots__ = ("api_endpoint", "session", "_cache", "_cache_lock", "_request_slots", "_fetch")
+    
+    # Maximum number of API requests in flight at once, per predictor
+    MAX_CONCURRENT_REQUESTS = 8
+    
+    # Maximum number of cached results kept before evicting the least recently used
+    CACHE_SIZE = 4096
+    
+    # Modalities predicted when the caller does not request specific ones
+    DEFAULT_MODALITIES = [
+        'gene_expression',
+        'splicing',
+        'chromatin_accessibility',
+        'histone_modifications',
+        'transcription_factor_binding'
+    ]
+    
+    # Placeholder result for every modality of a mock prediction. Shared by all
+    # mock responses, so it must be treated as read-only.
+    _MOCK_MODALITY = {
+        "score": None,  # Would be actual prediction
+        "direction": None,
+        "confidence": None,
+        "status": "awaiting_api_connection"
+    }
+    
+    def __init__(
+        self,
+        api_endpoint: str = "http://deepmind.google.com/science/alphagenome",
+        use_api: bool = False
+    ):
         """
         Initialize the AlphaGenome predictor.
         
         Args:
             api_endpoint: URL to the AlphaGenome API endpoint
+            use_api: Send requests to the API; when False, placeholder results are
+                returned until an API connection is available
         """
         self.api_endpoint = api_endpoint
         self.session = requests.Session()
-        logger.info(f"Initialized AlphaGenome predictor with endpoint: {api_endpoint}")
+        
+        # Keep pooled keep-alive connections to the API host and retry rate limits
+        # and transient gateway errors, so repeated variant requests reuse one
+        # TCP/TLS session. urllib3 does not retry POST by default; every endpoint
+        # here is deterministic and idempotent, so all methods are retried.
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=None
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+        
+        # Variant effects are deterministic in their inputs, so results are cached
+        # by ("predict"/"score", chromosome, position, ref, alt[, modalities]), up to
+        # CACHE_SIZE entries in least-recently-used order.
+        self._cache: OrderedDict[Tuple, Dict] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Bounds concurrent requests from the analyzer's worker threads so a fan-out
+        # stays within the API's concurrency budget instead of triggering 429s.
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        
+        # Pick the real or placeholder request path once, not on every call.
+        self._fetch = self._fetch_api if use_api else self._fetch_mock
+        logger.info("Initialized AlphaGenome predictor with endpoint: %s", api_endpoint)
     
     def get_sequence_context(
         self, 
@@ -86,31 +176,21 @@ class AlphaGenomePredictor:
         Returns:
             Dictionary with sequence context information
         """
-        logger.info(f"Fetching sequence context for {chromosome}:{position}")
-        
-        # In a real implementation, this would call the API
-        # For now, we'll create a mock response
-        try:
-            # This would be an actual API call
-            params = {
-                "chromosome": chromosome,
-                "position": position,
-                "context_size": context_size,
-                "species": "human"
-            }
-            # response = self.session.get(f"{self.api_endpoint}/sequence", params=params)
-            # return response.json()
-            
-            logger.warning("Using mock sequence context - connect to actual API for real predictions")
-            return {
-                "chromosome": chromosome,
-                "position": position,
-                "context_size": context_size,
-                "status": "mock_data"
-            }
-        except requests.RequestException as e:
-            logger.error(f"Error fetching sequence context: {e}")
-            return None
+        logger.info("Fetching sequence context for %s:%d", chromosome, position)
+        
+        params = {
+            "chromosome": chromosome,
+            "position": position,
+            "context_size": context_size,
+            "species": "human"
+        }
+        
+        with self._request_slots:
+            try:
+                return self._fetch("sequence", params)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("Error fetching sequence context: %s", e)
+                return None
     
     def predict_variant_effect(
         self,
@@ -134,51 +214,38 @@ class AlphaGenomePredictor:
             Dictionary with predicted variant effects across modalities
         """
         if modalities is None:
-            modalities = [
-                'gene_expression',
-                'splicing',
-                'chromatin_accessibility',
-                'histone_modifications',
-                'transcription_factor_binding'
-            ]
-        
-        logger.info(f"Predicting variant effects for {chromosome}:{position} {ref_allele}>{alt_allele}")
-        logger.info(f"Analyzing modalities: {', '.join(modalities)}")
-        
-        try:
-            # API request structure
-            variant_spec = {
-                "chromosome": chromosome,
-                "position": position,
-                "ref_allele": ref_allele,
-                "alt_allele": alt_allele,
-                "species": "human",
-                "modalities": modalities
-            }
-            
-            # In production: response = self.session.post(f"{self.api_endpoint}/predict", json=variant_spec)
-            # For now, return a mock prediction structure
-            logger.warning("Using mock predictions - connect to actual API for real variant effects")
-            
-            predictions = {
-                "variant": f"{chromosome}:{position}:{ref_allele}>{alt_allele}",
-                "modalities": {}
-            }
-            
-            # Add mock predictions for each modality
-            for modality in modalities:
-                predictions["modalities"][modality] = {
-                    "score": None,  # Would be actual prediction
-                    "direction": None,
-                    "confidence": None,
-                    "status": "awaiting_api_connection"
-                }
-            
-            return predictions
-            
-        except requests.RequestException as e:
-            logger.error(f"Error predicting variant effects: {e}")
-            return None
+            modalities = self.DEFAULT_MODALITIES
+        
+        key = ("predict", chromosome, position, ref_allele, alt_allele, tuple(modalities))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Predicting variant effects for %s:%d %s>%s\nAnalyzing modalities: %s",
+                chromosome, position, ref_allele, alt_allele, ", ".join(modalities)
+            )
+        
+        # API request structure
+        variant_spec = {
+            "chromosome": chromosome,
+            "position": position,
+            "ref_allele": ref_allele,
+            "alt_allele": alt_allele,
+            "species": "human",
+            "modalities": modalities
+        }
+        
+        with self._request_slots:
+            try:
+                predictions = self._fetch("predict", variant_spec)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("Error predicting variant effects: %s", e)
+                return None
+        
+        self._cache_put(key, predictions)
+        return predictions
     
     def score_variant(
         self,
@@ -199,35 +266,230 @@ class AlphaGenomePredictor:
         Returns:
             Dictionary with variant scores across modalities
         """
-        logger.info(f"Scoring variant {chromosome}:{position} {ref_allele}>{alt_allele}")
-        
-        try:
-            variant_spec = {
-                "chromosome": chromosome,
-                "position": position,
-                "ref_allele": ref_allele,
-                "alt_allele": alt_allele,
-                "quantile_calibration": True  # Use quantile-normalized scores
-            }
-            
-            # In production: response = self.session.post(f"{self.api_endpoint}/score", json=variant_spec)
-            logger.warning("Variant scoring awaiting API connection")
-            
-            return {
-                "variant": f"{chromosome}:{position}:{ref_allele}>{alt_allele}",
+        key = ("score", chromosome, position, ref_allele, alt_allele)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        logger.info("Scoring variant %s:%d %s>%s", chromosome, position, ref_allele, alt_allele)
+        
+        variant_spec = {
+            "chromosome": chromosome,
+            "position": position,
+            "ref_allele": ref_allele,
+            "alt_allele": alt_allele,
+            "quantile_calibration": True  # Use quantile-normalized scores
+        }
+        
+        with self._request_slots:
+            try:
+                scores = self._fetch("score", variant_spec)
+            except Exception as e:
+                logger.error("Error scoring variant: %s", e)
+                return None
+        
+        self._cache_put(key, scores)
+        return scores
+    
+    def predict_variants_batch(
+        self,
+        variants: List[Variant],
+        modalities: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        Predict the regulatory effects of several variants in a single request.
+        
+        Args:
+            variants: Variant records to predict
+            modalities: List of modalities to predict (defaults to DEFAULT_MODALITIES)
+        
+        Returns:
+            List of prediction dictionaries, in the same order as `variants`
+        """
+        if modalities is None:
+            modalities = self.DEFAULT_MODALITIES
+        
+        keys = [("predict", *v[:4], tuple(modalities)) for v in variants]
+        results = [self._cache_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        logger.info("Predicting variant effects for %d variants in one request", len(missing))
+        
+        batch_spec = {
+            "variants": [self._variant_fields(variants[i]) for i in missing],
+            "species": "human",
+            "modalities": modalities
+        }
+        
+        with self._request_slots:
+            try:
+                batch_results = self._fetch("predict_batch", batch_spec)
+            except (requests.RequestException, orjson.JSONDecodeError) as e:
+                logger.error("Error predicting variant effects: %s", e)
+                return results
+        
+        if not self._batch_matches(batch_results, missing):
+            logger.error(
+                "Error predicting variant effects: batch response does not match the %d requested variants",
+                len(missing)
+            )
+            return results
+        
+        for i, result in zip(missing, batch_results):
+            results[i] = result
+            self._cache_put(keys[i], result)
+        return results
+    
+    def score_variants_batch(self, variants: List[Variant]) -> List[Dict]:
+        """
+        Get quantitative effect scores for several variants in a single request.
+        
+        Args:
+            variants: Variant records to score
+        
+        Returns:
+            List of score dictionaries, in the same order as `variants`
+        """
+        keys = [("score", *v[:4]) for v in variants]
+        results = [self._cache_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        logger.info("Scoring %d variants in one request", len(missing))
+        
+        batch_spec = {
+            "variants": [self._variant_fields(variants[i]) for i in missing],
+            "quantile_calibration": True  # Use quantile-normalized scores
+        }
+        
+        with self._request_slots:
+            try:
+                batch_results = self._fetch("score_batch", batch_spec)
+            except Exception as e:
+                logger.error("Error scoring variants: %s", e)
+                return results
+        
+        if not self._batch_matches(batch_results, missing):
+            logger.error(
+                "Error scoring variants: batch response does not match the %d requested variants",
+                len(missing)
+            )
+            return results
+        
+        for i, result in zip(missing, batch_results):
+            results[i] = result
+            self._cache_put(keys[i], result)
+        return results
+    
+    def _cache_get(self, key: Tuple) -> Optional[Dict]:
+        """Return a cached result and mark it most recently used, or None on a miss."""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: Tuple, result: Dict) -> None:
+        """Cache a result, evicting the least recently used one beyond CACHE_SIZE."""
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def _fetch_api(self, endpoint: str, spec: Dict):
+        """Send a request to an API endpoint and return the decoded JSON body."""
+        if endpoint == "sequence":
+            response = self.session.get(f"{self.api_endpoint}/sequence", params=spec, timeout=60)
+        else:
+            response = self.session.post(f"{self.api_endpoint}/{endpoint}", json=spec, timeout=60)
+        response.raise_for_status()
+        # Parse straight from the raw bytes: response.json() first decodes the whole
+        # body into a str, which doubles peak memory for Mb-sized sequence payloads.
+        return orjson.loads(response.content)
+    
+    def _fetch_mock(self, endpoint: str, spec: Dict):
+        """Build the placeholder response for an API endpoint."""
+        return getattr(self, f"_mock_{endpoint}")(spec)
+    
+    @staticmethod
+    def _batch_matches(batch_results, requested: List[int]) -> bool:
+        """Check that a batch response holds exactly one result per requested variant."""
+        return isinstance(batch_results, list) and len(batch_results) == len(requested)
+    
+    @staticmethod
+    def _variant_fields(variant: Variant) -> Dict:
+        """Reduce a variant record to the fields the API identifies it by."""
+        return {
+            "chromosome": variant.chromosome,
+            "position": variant.position,
+            "ref_allele": variant.ref_allele,
+            "alt_allele": variant.alt_allele
+        }
+    
+    @staticmethod
+    def _mock_sequence(spec: Dict) -> Dict:
+        """Placeholder sequence context returned until the API is connected."""
+        logger.warning("Using mock sequence context - connect to actual API for real predictions")
+        return {
+            "chromosome": spec["chromosome"],
+            "position": spec["position"],
+            "context_size": spec["context_size"],
+            "status": "mock_data"
+        }
+    
+    @classmethod
+    def _mock_predict(cls, spec: Dict) -> Dict:
+        """Placeholder prediction returned until the API is connected."""
+        logger.warning("Using mock predictions - connect to actual API for real variant effects")
+        return cls._mock_prediction(spec, spec["modalities"])
+    
+    @classmethod
+    def _mock_predict_batch(cls, spec: Dict) -> List[Dict]:
+        """Placeholder batch predictions returned until the API is connected."""
+        logger.warning("Using mock predictions - connect to actual API for real variant effects")
+        return [cls._mock_prediction(variant, spec["modalities"]) for variant in spec["variants"]]
+    
+    @classmethod
+    def _mock_prediction(cls, variant: Dict, modalities: List[str]) -> Dict:
+        """Build one placeholder prediction, sharing the read-only modality entry."""
+        return {
+            "variant": f"{variant['chromosome']}:{variant['position']}:{variant['ref_allele']}>{variant['alt_allele']}",
+            "modalities": dict.fromkeys(modalities, cls._MOCK_MODALITY)
+        }
+    
+    @staticmethod
+    def _mock_score(spec: Dict) -> Dict:
+        """Placeholder scores returned until the API is connected."""
+        logger.warning("Variant scoring awaiting API connection")
+        return {
+            "variant": f"{spec['chromosome']}:{spec['position']}:{spec['ref_allele']}>{spec['alt_allele']}",
+            "scores": {}
+        }
+    
+    @staticmethod
+    def _mock_score_batch(spec: Dict) -> List[Dict]:
+        """Placeholder batch scores returned until the API is connected."""
+        logger.warning("Variant scoring awaiting API connection")
+        return [
+            {
+                "variant": f"{v['chromosome']}:{v['position']}:{v['ref_allele']}>{v['alt_allele']}",
                 "scores": {}
             }
-            
-        except Exception as e:
-            logger.error(f"Error scoring variant: {e}")
-            return None
+            for v in spec["variants"]
+        ]
 
 
 class SickleCellAnalyzer:
     """Specialized analyzer for sickle cell disease mutations."""
     
+    __slots__ = ("predictor", "results")
+    
     # Define the main sickle cell mutation
-    CLASSIC_SCD_MUTATION = SickleCell Mutation(
+    CLASSIC_SCD_MUTATION = SickleCellMutation(
         chromosome="chr11",
         position=5248232,  # GRCh38 coordinate (may vary by reference)
         ref_allele="C",
@@ -240,24 +502,62 @@ class SickleCellAnalyzer:
     
     # Related mutations that cause hemoglobinopathies
     RELATED_MUTATIONS = {
-        "HBB_E22K": {
-            "chromosome": "chr11",
-            "position": 5248243,
-            "ref_allele": "G",
-            "alt_allele": "A",
-            "gene": "HBB",
-            "description": "Hemoglobin E - relatively benign"
+        "HBB_E22K": Variant(
+            chromosome="chr11",
+            position=5248243,
+            ref_allele="G",
+            alt_allele="A",
+            gene="HBB",
+            description="Hemoglobin E - relatively benign"
+        ),
+        "HBB_CD39_deletion": Variant(
+            chromosome="chr11",
+            position=5248251,
+            ref_allele="TC",
+            alt_allele="T",
+            gene="HBB",
+            description="Hemoglobin Lepore-like deletion"
+        )
+    }
+    
+    # Maximum number of predictor calls in flight at once
+    MAX_WORKERS = 8
+    
+    # Expected consequences of the classic SCD mutation, used by _interpret_results
+    _EXPECTED_EFFECTS = {
+        "primary_effect": "Protein-coding mutation causing glutamic acid→valine substitution",
+        "protein_consequence": "Hemoglobin S polymerization under low oxygen conditions",
+        "regulatory_implications": "AlphaGenome will assess impacts on gene expression, splicing, and chromatin"
+    }
+    
+    # Interpretation returned by _interpret_results until predictions are available.
+    # Built once and shared by every result, so it must be treated as read-only;
+    # copy it before customizing it for a specific variant.
+    _STATIC_INTERPRETATION = {
+        "summary": "Awaiting AlphaGenome API connection for predictions",
+        "expected_effects": _EXPECTED_EFFECTS,
+        "clinical_context": {
+            "disease": "Sickle Cell Disease",
+            "inheritance": "Autosomal recessive",
+            "prevalence": "~100,000 affected in USA; 5% of world population carries trait",
+            "mechanism": "Valine causes Hb S polymerization → red blood cell sickling"
         },
-        "HBB_CD39_deletion": {
-            "chromosome": "chr11",
-            "position": 5248251,
-            "ref_allele": "TC",
-            "alt_allele": "T",
-            "gene": "HBB",
-            "description": "Hemoglobin Lepore-like deletion"
-        }
+        "next_steps": [
+            "1. Connect to AlphaGenome API for real predictions",
+            "2. Analyze regulatory changes in erythroid-specific cells",
+            "3. Compare with related HBB variants",
+            "4. Integrate with functional data from literature"
+        ]
     }
     
+    # Static report pieces, built once instead of on every generate_report() call
+    _BANNER = "=" * 80
+    _EXPECTED_EFFECTS_TEXT = "".join(
+        f"   • {key.replace('_', ' ').title()}: {value}\n" for key, value in _EXPECTED_EFFECTS.items()
+    )
+    _REPORT_HEADER = f"{_BANNER}\nALPHAGENOMIC ANALYSIS: SICKLE CELL DISEASE VARIANT INTERPRETATION\n{_BANNER}\n"
+    _REPORT_FOOTER = f"\n{_BANNER}"
+    
     def __init__(self, predictor: AlphaGenomePredictor):
         """Initialize sickle cell analyzer."""
         self.predictor = predictor
@@ -270,48 +570,54 @@ class SickleCellAnalyzer:
         Returns:
             Dictionary with comprehensive analysis results
         """
-        logger.info("=" * 80)
-        logger.info("ANALYZING CLASSIC SICKLE CELL DISEASE MUTATION")
-        logger.info("=" * 80)
-        
         mutation = self.CLASSIC_SCD_MUTATION
-        logger.info(f"\nMutation Details:")
-        logger.info(f"  Gene: {mutation.gene}")
-        logger.info(f"  Location: {mutation.chromosome}:{mutation.position}")
-        logger.info(f"  Change: {mutation.ref_allele}>{mutation.alt_allele}")
-        logger.info(f"  HGVS: {mutation.hgvs_notation}")
-        logger.info(f"  Significance: {mutation.clinical_significance}")
-        
-        # Get sequence context
-        logger.info("\nStep 1: Retrieving sequence context (1 Mb region)...")
-        seq_context = self.predictor.get_sequence_context(
-            mutation.chromosome,
-            mutation.position
-        )
-        
-        # Predict variant effects
-        logger.info("\nStep 2: Predicting regulatory variant effects...")
-        predictions = self.predictor.predict_variant_effect(
-            mutation.chromosome,
-            mutation.position,
-            mutation.ref_allele,
-            mutation.alt_allele,
-            modalities=[
-                'gene_expression',
-                'splicing',
-                'chromatin_accessibility',
-                'histone_modifications',
-                'transcription_factor_binding'
-            ]
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join([
+                "=" * 80,
+                "ANALYZING CLASSIC SICKLE CELL DISEASE MUTATION",
+                "=" * 80,
+                "",
+                "Mutation Details:",
+                f"  Gene: {mutation.gene}",
+                f"  Location: {mutation.chromosome}:{mutation.position}",
+                f"  Change: {mutation.ref_allele}>{mutation.alt_allele}",
+                f"  HGVS: {mutation.hgvs_notation}",
+                f"  Significance: {mutation.clinical_significance}"
+            ]))
         
-        # Score variant across modalities
-        logger.info("\nStep 3: Scoring variant effects...")
-        scores = self.predictor.score_variant(
-            mutation.chromosome,
-            mutation.position,
-            mutation.ref_allele,
-            mutation.alt_allele
+        # The three steps are independent requests, so issue them up front and
+        # let them run concurrently; results are only gathered when compiled.
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            # Get sequence context
+            logger.info("\nStep 1: Retrieving sequence context (1 Mb region)...")
+            seq_context = pool.submit(
+                self.predictor.get_sequence_context,
+                mutation.chromosome,
+                mutation.position
+            )
+            
+            # Predict variant effects
+            logger.info("\nStep 2: Predicting regulatory variant effects...")
+            predictions = pool.submit(
+                self.predictor.predict_variant_effect,
+                mutation.chromosome,
+                mutation.position,
+                mutation.ref_allele,
+                mutation.alt_allele,
+                modalities=self.predictor.DEFAULT_MODALITIES
+            )
+            
+            # Score variant across modalities
+            logger.info("\nStep 3: Scoring variant effects...")
+            scores = pool.submit(
+                self.predictor.score_variant,
+                mutation.chromosome,
+                mutation.position,
+                mutation.ref_allele,
+                mutation.alt_allele
+            )
+        seq_context, predictions, scores = (
+            seq_context.result(), predictions.result(), scores.result()
         )
         
         # Compile results
@@ -336,33 +642,31 @@ class SickleCellAnalyzer:
     
     def analyze_related_mutations(self) -> Dict:
         """Analyze related hemoglobinopathy mutations."""
-        logger.info("\n" + "=" * 80)
-        logger.info("ANALYZING RELATED HEMOGLOBINOPATHY MUTATIONS")
-        logger.info("=" * 80)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\n".join(
+                ["", "=" * 80, "ANALYZING RELATED HEMOGLOBINOPATHY MUTATIONS", "=" * 80]
+                + [
+                    f"\nAnalyzing {mutation_id}: {mutation.description}"
+                    for mutation_id, mutation in self.RELATED_MUTATIONS.items()
+                ]
+            ))
         
-        related_results = {}
+        # Send every related mutation in one batch request per endpoint, and run the
+        # two independent batch requests concurrently.
+        mutation_ids = list(self.RELATED_MUTATIONS)
+        variants = list(self.RELATED_MUTATIONS.values())
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            predictions = pool.submit(self.predictor.predict_variants_batch, variants)
+            scores = pool.submit(self.predictor.score_variants_batch, variants)
         
-        for mutation_id, mutation_data in self.RELATED_MUTATIONS.items():
-            logger.info(f"\nAnalyzing {mutation_id}: {mutation_data['description']}")
-            
-            predictions = self.predictor.predict_variant_effect(
-                mutation_data['chromosome'],
-                mutation_data['position'],
-                mutation_data['ref_allele'],
-                mutation_data['alt_allele']
-            )
-            
-            scores = self.predictor.score_variant(
-                mutation_data['chromosome'],
-                mutation_data['position'],
-                mutation_data['ref_allele'],
-                mutation_data['alt_allele']
-            )
-            
+        related_results = {}
+        for mutation_id, mutation, prediction, score in zip(
+            mutation_ids, variants, predictions.result(), scores.result()
+        ):
             related_results[mutation_id] = {
-                "mutation_data": mutation_data,
-                "predictions": predictions,
-                "scores": scores
+                "mutation_data": mutation._asdict(),
+                "predictions": prediction,
+                "scores": score
             }
         
         self.results['related_mutations'] = related_results
@@ -379,64 +683,58 @@ class SickleCellAnalyzer:
         Returns:
             Dictionary with clinical interpretation
         """
-        interpretation = {
-            "summary": "Awaiting AlphaGenome API connection for predictions",
-            "expected_effects": {
-                "primary_effect": "Protein-coding mutation causing glutamic acid→valine substitution",
-                "protein_consequence": "Hemoglobin S polymerization under low oxygen conditions",
-                "regulatory_implications": "AlphaGenome will assess impacts on gene expression, splicing, and chromatin"
-            },
-            "clinical_context": {
-                "disease": "Sickle Cell Disease",
-                "inheritance": "Autosomal recessive",
-                "prevalence": "~100,000 affected in USA; 5% of world population carries trait",
-                "mechanism": "Valine causes Hb S polymerization → red blood cell sickling"
-            },
-            "next_steps": [
-                "1. Connect to AlphaGenome API for real predictions",
-                "2. Analyze regulatory changes in erythroid-specific cells",
-                "3. Compare with related HBB variants",
-                "4. Integrate with functional data from literature"
-            ]
-        }
-        return interpretation
+        return self._STATIC_INTERPRETATION
     
     def generate_report(self) -> str:
         """Generate a formatted clinical analysis report."""
         if not self.results:
             return "No analysis results available. Run analyze_classic_scd() first."
         
-        report = []
-        report.append("=" * 80)
-        report.append("ALPHAGENOMIC ANALYSIS: SICKLE CELL DISEASE VARIANT INTERPRETATION")
-        report.append("=" * 80)
+        report = io.StringIO()
+        write = report.write
+        write(self._REPORT_HEADER)
         
         if 'classic_scd' in self.results:
             scd_result = self.results['classic_scd']
-            report.append("\n1. MUTATION SUMMARY")
-            report.append(f"   Gene: {scd_result['mutation']['gene']}")
-            report.append(f"   Variant: {scd_result['mutation']['chromosome']}:{scd_result['mutation']['position']}")
-            report.append(f"   Change: {scd_result['mutation']['ref']}→{scd_result['mutation']['alt']}")
-            report.append(f"   HGVS: {scd_result['mutation']['hgvs']}")
+            mutation = scd_result['mutation']
+            write("\n1. MUTATION SUMMARY\n")
+            write(f"   Gene: {mutation['gene']}\n")
+            write(f"   Variant: {mutation['chromosome']}:{mutation['position']}\n")
+            write(f"   Change: {mutation['ref']}→{mutation['alt']}\n")
+            write(f"   HGVS: {mutation['hgvs']}\n")
             
-            report.append("\n2. PREDICTED REGULATORY EFFECTS")
+            write("\n2. PREDICTED REGULATORY EFFECTS\n")
             if scd_result['predictions'] and 'modalities' in scd_result['predictions']:
                 for modality, effect in scd_result['predictions']['modalities'].items():
-                    report.append(f"   • {modality.replace('_', ' ').title()}: {effect['status']}")
+                    write(f"   • {modality.replace('_', ' ').title()}: {effect['status']}\n")
             
-            report.append("\n3. QUANTITATIVE SCORES")
+            write("\n3. QUANTITATIVE SCORES\n")
             if scd_result['scores']:
-                report.append(f"   Status: {scd_result['scores'].get('status', 'Awaiting API')}")
+                write(f"   Status: {scd_result['scores'].get('status', 'Awaiting API')}\n")
             
-            report.append("\n4. CLINICAL INTERPRETATION")
+            write("\n4. CLINICAL INTERPRETATION\n")
             interp = scd_result['interpretation']
-            report.append(f"   {interp['summary']}")
-            report.append("\n   Expected Primary Effects:")
-            for key, value in interp['expected_effects'].items():
-                report.append(f"   • {key.replace('_', ' ').title()}: {value}")
+            write(f"   {interp['summary']}\n")
+            write("\n   Expected Primary Effects:\n")
+            expected_effects = interp['expected_effects']
+            if expected_effects is self._EXPECTED_EFFECTS:
+                write(self._EXPECTED_EFFECTS_TEXT)
+            else:
+                for key, value in expected_effects.items():
+                    write(f"   • {key.replace('_', ' ').title()}: {value}\n")
         
-        report.append("\n" + "=" * 80)
-        return "\n".join(report)
+        write(self._REPORT_FOOTER)
+        return report.getvalue()
+
+
+def _write_results(output_file: str, results: Dict) -> None:
+    """Serialize analysis results to a JSON file."""
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            default=str
+        ))
 
 
 def main():
@@ -449,34 +747,39 @@ def main():
     # Create analyzer
     analyzer = SickleCellAnalyzer(predictor)
     
-    # Analyze classic SCD mutation
+    # Analyze the classic SCD mutation and the related mutations concurrently;
+    # the two analyses share no state and are bound by API round-trips.
     logger.info("\n" + "🔬 " * 20)
-    scd_results = analyzer.analyze_classic_scd()
-    
-    # Analyze related mutations
-    related_results = analyzer.analyze_related_mutations()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        scd_future = pool.submit(analyzer.analyze_classic_scd)
+        related_future = pool.submit(analyzer.analyze_related_mutations)
+        scd_results = scd_future.result()
+        related_results = related_future.result()
     
     # Generate report
     report = analyzer.generate_report()
-    print(report)
-    
-    # Save results to JSON
-    output_file = "/home/claude/sickle_cell_alphagenome_results.json"
-    with open(output_file, 'w') as f:
-        json.dump({
-            "classic_scd": scd_results,
-            "related_mutations": related_results,
-            "report": report
-        }, f, indent=2, default=str)
-    
-    logger.info(f"\nResults saved to {output_file}")
-    
-    return {
+    results = {
         "classic_scd": scd_results,
         "related_mutations": related_results,
         "report": report
     }
+    
+    # Save results to JSON on a worker thread while the report is printed
+    output_file = "/home/claude/sickle_cell_alphagenome_results.json"
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        write_future = pool.submit(_write_results, output_file, results)
+        print(report)
+        write_future.result()
+    
+    logger.info("\nResults saved to %s", output_file)
+    
+    return results
 
 
 if __name__ == "__main__":
+    # Configure logging only when run as a script, so importers keep their own setup
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
     results = main()